@@ -9,6 +9,7 @@ class Settings(BaseSettings):
 
     host: str = "0.0.0.0"
     port: int = 8080
+    workers: int = 1
     base_url: str = "http://localhost:8080"
     upload_dir: Path = Path("./uploads")
     data_dir: Path = Path("./data")
@@ -16,6 +17,10 @@ class Settings(BaseSettings):
     expiry_hours: int = 24
     template_expiry_days: int = 7
     max_template_size_kb: int = 100
+    io_chunk_size_kb: int = 1024
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
@@ -29,6 +34,11 @@ class Settings(BaseSettings):
         """Return max template size in bytes."""
         return self.max_template_size_kb * 1024
 
+    @property
+    def io_chunk_size_bytes(self) -> int:
+        """Return streaming I/O chunk size in bytes."""
+        return self.io_chunk_size_kb * 1024
+
     @property
     def database_url(self) -> str:
         """Return SQLite database URL."""
@@ -2,24 +2,103 @@
 
 from collections.abc import Generator
 
+from sqlalchemy import event, inspect
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, SQLModel, create_engine
 
+from cloud_mover import models  # noqa: F401  # populate SQLModel.metadata
 from cloud_mover.config import settings
 
+# Bump whenever the table definitions in models.py change so init_db runs
+# _migrate_schema against existing data directories; create_all alone only
+# covers fresh databases.
+SCHEMA_VERSION = "3"
+
 engine = create_engine(
     settings.database_url,
     echo=False,
     connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=True,
+    pool_recycle=1800,
 )
 
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Enable WAL and friendly pragmas on every new SQLite connection.
+
+    WAL lets readers proceed while a writer commits; NORMAL synchronous is
+    safe under WAL and skips an fsync per transaction; busy_timeout retries
+    briefly instead of failing immediately on a locked database.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def _migrate_schema() -> None:
+    """Bring an existing database up to the current model definitions.
+
+    create_all only creates missing tables — it never touches ones that
+    already exist, so model changes to existing tables need explicit DDL.
+    """
+    SQLModel.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    connection.exec_driver_sql(
+                        f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" '
+                        f"{column.type.compile(engine.dialect)}"
+                    )
+
+        # create_all skips indexes on existing tables as well
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+
 def init_db() -> None:
-    """Initialize database and create all tables."""
+    """Initialize database, creating or migrating tables when schema changed.
+
+    Skipped entirely when the data directory already carries the current
+    schema version stamp; a fresh database gets create_all, an existing one
+    with a stale stamp gets migrated.
+    """
     settings.data_dir.mkdir(parents=True, exist_ok=True)
-    SQLModel.metadata.create_all(engine)
+
+    version_file = settings.data_dir / ".schema_version"
+    db_file = settings.data_dir / "cloud_mover.db"
+    stamp = version_file.read_text().strip() if version_file.exists() else None
+
+    if not db_file.exists():
+        SQLModel.metadata.create_all(engine)
+        version_file.write_text(SCHEMA_VERSION)
+    elif stamp != SCHEMA_VERSION:
+        _migrate_schema()
+        version_file.write_text(SCHEMA_VERSION)
+
+    # Warm the pool eagerly so early requests check out already-open
+    # connections instead of each paying the SQLite open + pragma cost.
+    connections = [engine.connect() for _ in range(settings.db_pool_size)]
+    for connection in connections:
+        connection.close()
 
 
 def get_session() -> Generator[Session, None, None]:
-    """Yield a database session for dependency injection."""
-    with Session(engine) as session:
+    """Yield a database session for dependency injection.
+
+    expire_on_commit is disabled so rows written in a request stay readable
+    after commit without an extra refresh SELECT.
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
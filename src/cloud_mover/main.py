@@ -1,28 +1,39 @@
 """Cloud-Mover FastAPI application."""
 
 import asyncio
+import fcntl
+import gzip
+import hashlib
+import logging
+import os
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import PlainTextResponse
-from sqlmodel import Session
+from sqlmodel import Session, func, select
 
 from cloud_mover.config import settings
 from cloud_mover.database import engine, init_db
+from cloud_mover.models import Backup, Template
 from cloud_mover.routers import api
 from cloud_mover.services.cleanup import cleanup_expired_backups, cleanup_expired_templates
 
+CLEANUP_FALLBACK_SECONDS = 3600
+CLEANUP_MIN_SECONDS = 60
 
-def get_api_documentation() -> str:
-    """Generate API documentation with current base_url."""
-    return f"""# Cloud-Mover API
+logger = logging.getLogger(__name__)
+
+
+_API_DOC_TEMPLATE = """# Cloud-Mover API
 
 AI Assistant migration helper. Transfer settings between machines securely.
 
-Service URL: {settings.base_url}
-Max file size: {settings.max_file_size_mb}MB
-Expiry: {settings.expiry_hours} hours
+Service URL: {base_url}
+Max file size: {max_file_size_mb}MB
+Expiry: {expiry_hours} hours
 
 ---
 
@@ -60,10 +71,10 @@ User might say: "use code abc123", "import template xyz789", "download template"
 
 ```bash
 # Get template info
-curl {settings.base_url}/templates/[CODE]
+curl {base_url}/templates/[CODE]
 
 # Download raw content
-curl {settings.base_url}/templates/[CODE]/raw -o CLAUDE.md
+curl {base_url}/templates/[CODE]/raw -o CLAUDE.md
 ```
 
 Or use the API directly and save based on `template_type` field (CLAUDE.md or AGENTS.md).
@@ -77,12 +88,12 @@ User might say: "share my CLAUDE.md", "export this template"
 3. POST to /templates:
 
 ```bash
-curl -X POST {settings.base_url}/templates \\
+curl -X POST {base_url}/templates \\
   -H "Content-Type: application/json" \\
   -d '{{"template_type": "CLAUDE.md", "title": "...", "content": "..."}}'
 ```
 
-4. Give user the 6-character code (valid for {settings.template_expiry_days} days)
+4. Give user the 6-character code (valid for {template_expiry_days} days)
 
 ---
 
@@ -269,7 +280,7 @@ Create `/tmp/backup/INSTALL.md`:
 du -sh /tmp/backup/
 ```
 
-If larger than {settings.max_file_size_mb}MB:
+If larger than {max_file_size_mb}MB:
 ```bash
 # Find large files
 find /tmp/backup -type f -size +1M -exec ls -lh {{}} \\; | sort -k5 -hr | head -20
@@ -298,7 +309,7 @@ zip -r -P "PASSWORD" ~/backup.zip .
 
 **Upload:**
 ```
-POST {settings.base_url}/upload
+POST {base_url}/upload
 Content-Type: multipart/form-data
 file: <zip file>
 ```
@@ -306,7 +317,7 @@ file: <zip file>
 **Tell user:**
 - Verification code: [6 chars from response]
 - Zip password: [their password]
-- Valid for: {settings.expiry_hours} hours
+- Valid for: {expiry_hours} hours
 
 ---
 
@@ -318,7 +329,7 @@ file: <zip file>
 
 **Download:**
 ```bash
-curl -o backup.zip {settings.base_url}/download/[CODE]
+curl -o backup.zip {base_url}/download/[CODE]
 ```
 
 **Extract (Python - works on all systems):**
@@ -413,7 +424,7 @@ cp -r ~/restore/projects/[name] /path/user/chose/
 #### POST /upload
 Upload backup file, receive verification code.
 
-**Request:** `multipart/form-data`, field `file` (max {settings.max_file_size_mb}MB)
+**Request:** `multipart/form-data`, field `file` (max {max_file_size_mb}MB)
 
 **Response:**
 ```json
@@ -447,14 +458,14 @@ Share a template and receive a verification code.
 - `template_type`: `"CLAUDE.md"` or `"AGENTS.md"`
 - `title`: Template name (max 100 chars)
 - `description`: Optional description (max 500 chars)
-- `content`: Markdown content (max {settings.max_template_size_kb}KB)
+- `content`: Markdown content (max {max_template_size_kb}KB)
 
 **Response:**
 ```json
 {{"code": "xyz789", "expires_at": "2024-01-08T12:00:00Z", "message": "..."}}
 ```
 
-**Expiry:** {settings.template_expiry_days} days
+**Expiry:** {template_expiry_days} days
 
 #### GET /templates/{{code}}
 Get template metadata and content as JSON.
@@ -488,38 +499,117 @@ Get raw template content as plain text (for direct file download).
 """.strip()
 
 
-async def periodic_cleanup():
-    """Run cleanup every hour."""
-    while True:
-        await asyncio.sleep(3600)
-        with Session(engine) as session:
-            backup_count = cleanup_expired_backups(session)
-            template_count = cleanup_expired_templates(session)
-            if backup_count > 0:
-                print(f"Cleaned up {backup_count} expired backups")
-            if template_count > 0:
-                print(f"Cleaned up {template_count} expired templates")
+@lru_cache(maxsize=1)
+def get_api_documentation() -> str:
+    """Generate API documentation with current base_url.
+
+    Cached: settings never change after startup, so the multi-kilobyte
+    document is rendered from the static template exactly once.
+    """
+    return _API_DOC_TEMPLATE.format(
+        base_url=settings.base_url,
+        max_file_size_mb=settings.max_file_size_mb,
+        expiry_hours=settings.expiry_hours,
+        template_expiry_days=settings.template_expiry_days,
+        max_template_size_kb=settings.max_template_size_kb,
+    )
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan handler."""
-    init_db()
-    settings.upload_dir.mkdir(parents=True, exist_ok=True)
+def next_cleanup_delay() -> float:
+    """Seconds until the soonest backup/template expiry, clamped to [min, fallback]."""
+    with Session(engine) as session:
+        deadlines = [
+            deadline
+            for deadline in (
+                session.exec(select(func.min(Backup.expires_at))).one(),
+                session.exec(select(func.min(Template.expires_at))).one(),
+            )
+            if deadline is not None
+        ]
+
+    if not deadlines:
+        return CLEANUP_FALLBACK_SECONDS
+
+    soonest = min(deadlines)
+    if soonest.tzinfo is None:
+        soonest = soonest.replace(tzinfo=timezone.utc)
+    delay = (soonest - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, CLEANUP_MIN_SECONDS), CLEANUP_FALLBACK_SECONDS)
+
+
+def try_acquire_cleanup_lock() -> int | None:
+    """Try to become the cleanup leader via a non-blocking flock.
+
+    With uvicorn running multiple workers, every worker executes lifespan;
+    only the one holding the lock runs cleanup. The fd stays open for the
+    process lifetime and the OS releases the lock if the worker dies.
+    Returns the held fd, or None when another worker is the leader.
+    """
+    fd = os.open(settings.data_dir / "cleanup.lock", os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
 
+def run_cleanup() -> tuple[int, int]:
+    """Delete expired backups and templates, returning (backup, template) counts."""
     with Session(engine) as session:
-        cleanup_expired_backups(session)
-        cleanup_expired_templates(session)
+        return cleanup_expired_backups(session), cleanup_expired_templates(session)
 
-    cleanup_task = asyncio.create_task(periodic_cleanup())
 
-    yield
+async def periodic_cleanup(shutdown: asyncio.Event):
+    """Run cleanup when the next expiry deadline passes, not on a fixed poll.
+
+    Exits promptly and cleanly when the shutdown event is set instead of
+    relying on task cancellation.
+    """
+    while not shutdown.is_set():
+        delay = await asyncio.to_thread(next_cleanup_delay)
+        try:
+            await asyncio.wait_for(shutdown.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+        else:
+            break
+
+        backup_count, template_count = await asyncio.to_thread(run_cleanup)
+        if backup_count > 0:
+            logger.info("Cleaned up %d expired backups", backup_count)
+        if template_count > 0:
+            logger.info("Cleaned up %d expired templates", template_count)
 
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler."""
+    # Independent startup steps run concurrently; the group re-raises if
+    # either fails so the app never starts half-initialized.
+    async with asyncio.TaskGroup() as startup:
+        startup.create_task(asyncio.to_thread(init_db))
+        startup.create_task(
+            asyncio.to_thread(settings.upload_dir.mkdir, parents=True, exist_ok=True)
+        )
+
+    cleanup_lock_fd = try_acquire_cleanup_lock()
+    if cleanup_lock_fd is not None:
+        await asyncio.to_thread(run_cleanup)
+
+    shutdown_event = asyncio.Event()
+    async with asyncio.TaskGroup() as tg:
+        if cleanup_lock_fd is not None:
+            tg.create_task(periodic_cleanup(shutdown_event))
+        try:
+            yield
+        finally:
+            # Leaving the group awaits the cleanup task, which exits once
+            # the event is set.
+            shutdown_event.set()
+
+    if cleanup_lock_fd is not None:
+        os.close(cleanup_lock_fd)
 
 
 app = FastAPI(
@@ -532,10 +622,38 @@ app = FastAPI(
 app.include_router(api.router)
 
 
+@lru_cache(maxsize=1)
+def _api_doc_payload() -> tuple[bytes, bytes, str]:
+    """Return the doc body, its gzipped variant, and the ETag, computed once.
+
+    Only the expensive parts are cached; each request gets its own Response
+    object because anything sharing the instance would leak one request's
+    header mutations into the next.
+    """
+    body = get_api_documentation().encode("utf-8")
+    return body, gzip.compress(body, compresslevel=9), f'"{hashlib.md5(body).hexdigest()}"'
+
+
 @app.get("/", response_class=PlainTextResponse)
-def root():
+def root(request: Request):
     """Return API documentation for AI assistants to read."""
-    return get_api_documentation()
+    body, gzipped, etag = _api_doc_payload()
+
+    headers = {
+        "Cache-Control": "public, max-age=3600",
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = gzipped
+    return Response(
+        content=body,
+        media_type="text/plain; charset=utf-8",
+        headers=headers,
+    )
 
 
 def main():
@@ -545,6 +663,9 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=False,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.workers,
     )
 
 
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -16,11 +17,17 @@ class Backup(SQLModel, table=True):
     """Backup table for storing upload metadata."""
 
     __tablename__ = "backups"
+    __table_args__ = (
+        # Lookups filter on code AND expires_at; cleanup scans by expires_at
+        Index("ix_backups_code_expires", "code", "expires_at"),
+        Index("ix_backups_expires", "expires_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     code: str = Field(unique=True, index=True, max_length=6)
     file_path: str
     file_size: int
+    sha256: Optional[str] = Field(default=None, max_length=64)
     uploaded_at: datetime = Field(default_factory=_utc_now)
     expires_at: datetime
 
@@ -36,6 +43,10 @@ class Template(SQLModel, table=True):
     """Template table for storing shared templates."""
 
     __tablename__ = "templates"
+    __table_args__ = (
+        Index("ix_templates_code_expires", "code", "expires_at"),
+        Index("ix_templates_expires", "expires_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     code: str = Field(unique=True, index=True, max_length=6)
@@ -1,11 +1,13 @@
 """API routes for Cloud-Mover."""
 
+import base64
+import hashlib
 import os
-import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from sqlmodel import Session
 
 from cloud_mover.config import settings
@@ -18,7 +20,7 @@ from cloud_mover.schemas import (
     UploadResponse,
 )
 from cloud_mover.services.auth import is_valid_code
-from cloud_mover.services.backup import create_backup, get_backup_by_code
+from cloud_mover.services.backup import allocate_code, create_backup, get_backup_by_code
 from cloud_mover.services.template import (
     create_template,
     get_template_by_code,
@@ -28,6 +30,12 @@ from cloud_mover.services.template import (
 router = APIRouter()
 
 
+def _write_and_hash(f, hasher, chunk: bytes) -> None:
+    """Write a chunk and fold it into the digest in one threadpool hop."""
+    f.write(chunk)
+    hasher.update(chunk)
+
+
 def _format_size(size_bytes: int) -> str:
     """Format bytes to human readable string."""
     if size_bytes < 1024:
@@ -48,37 +56,55 @@ async def upload(
     session: Annotated[Session, Depends(get_session)],
 ):
     """Upload a backup file and get a verification code."""
-    contents = await file.read()
-    file_size = len(contents)
-
-    if file_size > settings.max_file_size_bytes:
-        actual_size = _format_size(file_size)
-        max_size = f"{settings.max_file_size_mb}MB"
-        excess = _format_size(file_size - settings.max_file_size_bytes)
-
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"File too large: {actual_size} (limit: {max_size}, excess: {excess}). "
-                f"Please reduce size by excluding: "
-                f"(1) node_modules directories, "
-                f"(2) AI models or large binaries, "
-                f"(3) cache files, "
-                f"(4) items that can be reinstalled. "
-                f"Use 'du -sh ~/.claude/*/' to identify large folders."
-            ),
+    # The verification code doubles as the filename: one source of entropy,
+    # and the path is derivable from the code. Sharding by the first two
+    # characters keeps individual directories small at scale.
+    code = await run_in_threadpool(allocate_code, session)
+    shard_dir = settings.upload_dir / code[:2]
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    file_path = str(shard_dir / f"{code}.zip")
+
+    # Stream to disk in chunks instead of buffering the whole body in memory,
+    # rejecting as soon as the running size passes the limit. Hashing rides
+    # along on the same pass over the bytes.
+    file_size = 0
+    hasher = hashlib.sha256()
+    try:
+        with open(file_path, "wb") as f:
+            while chunk := await file.read(settings.io_chunk_size_bytes):
+                file_size += len(chunk)
+                if file_size > settings.max_file_size_bytes:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=(
+                            f"File too large: exceeds {settings.max_file_size_mb}MB limit "
+                            f"(received {_format_size(file_size)} before aborting). "
+                            f"Please reduce size by excluding: "
+                            f"(1) node_modules directories, "
+                            f"(2) AI models or large binaries, "
+                            f"(3) cache files, "
+                            f"(4) items that can be reinstalled. "
+                            f"Use 'du -sh ~/.claude/*/' to identify large folders."
+                        ),
+                    )
+                await run_in_threadpool(_write_and_hash, f, hasher, chunk)
+
+        # Sync DB work must not run on the event loop inside this async endpoint
+        backup = await run_in_threadpool(
+            create_backup, session, code, file_path, file_size, hasher.hexdigest()
         )
+    except BaseException:
+        # Drop the file whether the stream or the insert failed, so no
+        # unreferenced zip is left behind
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
 
-    settings.upload_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{uuid.uuid4().hex}.zip"
-    file_path = str(settings.upload_dir / filename)
-
-    with open(file_path, "wb") as f:
-        f.write(contents)
-
-    backup = create_backup(session, file_path, file_size)
-
-    return UploadResponse(code=backup.code, expires_at=backup.expires_at)
+    # Returning a Response skips FastAPI's re-validation of the payload
+    # against response_model; the model still documents the schema and is
+    # validated once at construction.
+    response = UploadResponse(code=backup.code, expires_at=backup.expires_at)
+    return JSONResponse(content=response.model_dump(mode="json"))
 
 
 @router.get(
@@ -97,14 +123,27 @@ def download(
     if not backup:
         raise HTTPException(status_code=404, detail="Verification code not found or expired")
 
-    if not os.path.exists(backup.file_path):
+    # One stat covers both the existence check and FileResponse's metadata,
+    # and the larger chunk size beats Starlette's 64 KB default.
+    try:
+        stat_result = os.stat(backup.file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Backup file not found")
 
-    return FileResponse(
+    headers = {}
+    if backup.sha256:
+        digest = base64.b64encode(bytes.fromhex(backup.sha256)).decode("ascii")
+        headers["Digest"] = f"sha-256={digest}"
+
+    response = FileResponse(
         backup.file_path,
         media_type="application/zip",
         filename=f"claude-backup-{code}.zip",
+        stat_result=stat_result,
+        headers=headers,
     )
+    response.chunk_size = settings.io_chunk_size_bytes
+    return response
 
 
 # Template sharing endpoints
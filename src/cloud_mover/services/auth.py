@@ -1,17 +1,21 @@
 """Authentication service for code generation."""
 
+import base64
+import re
 import secrets
-import string
+
+_CODE_FULLMATCH = re.compile(r"[a-z0-9]{6}").fullmatch
 
 
 def generate_code() -> str:
-    """Generate a 6-character alphanumeric lowercase code."""
-    alphabet = string.ascii_lowercase + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(6))
+    """Generate a 6-character alphanumeric lowercase code.
+
+    One CSPRNG read encoded as lowercase base32 ([a-z2-7]) instead of six
+    secrets.choice calls; the result stays within the validated charset.
+    """
+    return base64.b32encode(secrets.token_bytes(4)).decode("ascii").lower()[:6]
 
 
 def is_valid_code(code: str) -> bool:
     """Validate code format: 6 alphanumeric lowercase characters."""
-    if len(code) != 6:
-        return False
-    return code.isalnum() and code.islower()
+    return _CODE_FULLMATCH(code) is not None
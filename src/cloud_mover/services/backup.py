@@ -9,35 +9,48 @@ from cloud_mover.config import settings
 from cloud_mover.models import Backup
 from cloud_mover.services.auth import generate_code
 
-MAX_CODE_GENERATION_ATTEMPTS = 100
+CODE_BATCH_SIZE = 16
+MAX_CODE_BATCH_ATTEMPTS = 8
+
+
+def allocate_code(session: Session) -> str:
+    """Pick a verification code not present in the backups table.
+
+    Generates a batch of candidates and rules them out with a single
+    indexed IN lookup instead of one SELECT per candidate.
+    """
+    for _ in range(MAX_CODE_BATCH_ATTEMPTS):
+        candidates = {generate_code() for _ in range(CODE_BATCH_SIZE)}
+        taken = set(
+            session.exec(select(Backup.code).where(Backup.code.in_(candidates))).all()
+        )
+        available = candidates - taken
+        if available:
+            return available.pop()
+    raise RuntimeError("Failed to generate unique code after max attempts")
 
 
 def create_backup(
     session: Session,
+    code: str,
     file_path: str,
     file_size: int,
+    sha256: Optional[str] = None,
 ) -> Backup:
-    """Create a new backup record with unique code."""
-    # Generate unique code
-    for _ in range(MAX_CODE_GENERATION_ATTEMPTS):
-        code = generate_code()
-        existing = session.exec(select(Backup).where(Backup.code == code)).first()
-        if not existing:
-            break
-    else:
-        raise RuntimeError("Failed to generate unique code after max attempts")
-
+    """Create a new backup record under a previously allocated code."""
     expires_at = datetime.now(timezone.utc) + timedelta(hours=settings.expiry_hours)
 
     backup = Backup(
         code=code,
         file_path=file_path,
         file_size=file_size,
+        sha256=sha256,
         expires_at=expires_at,
     )
+    # commit's flush assigns the primary key, and sessions keep attributes
+    # live after commit, so no refresh round-trip is needed
     session.add(backup)
     session.commit()
-    session.refresh(backup)
 
     return backup
 
@@ -3,7 +3,7 @@
 import os
 from datetime import datetime, timezone
 
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 
 from cloud_mover.models import Backup, Template
 
@@ -12,21 +12,20 @@ def cleanup_expired_backups(session: Session) -> int:
     """Delete expired backups and their files. Returns count of deleted items."""
     now = datetime.now(timezone.utc)
 
-    expired = session.exec(select(Backup).where(Backup.expires_at < now)).all()
-
-    count = 0
-    for backup in expired:
-        if os.path.exists(backup.file_path):
-            try:
-                os.remove(backup.file_path)
-            except OSError:
-                pass
-        session.delete(backup)
-        count += 1
+    # Read just the file paths, then drop all expired rows in one DELETE
+    # instead of loading full rows and deleting them one by one
+    paths = session.exec(select(Backup.file_path).where(Backup.expires_at < now)).all()
+    count = session.exec(delete(Backup).where(Backup.expires_at < now)).rowcount
 
     if count > 0:
         session.commit()
 
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     return count
 
 
@@ -34,12 +33,7 @@ def cleanup_expired_templates(session: Session) -> int:
     """Delete expired templates. Returns count of deleted items."""
     now = datetime.now(timezone.utc)
 
-    expired = session.exec(select(Template).where(Template.expires_at < now)).all()
-
-    count = 0
-    for template in expired:
-        session.delete(template)
-        count += 1
+    count = session.exec(delete(Template).where(Template.expires_at < now)).rowcount
 
     if count > 0:
         session.commit()
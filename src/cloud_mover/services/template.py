@@ -9,7 +9,8 @@ from cloud_mover.config import settings
 from cloud_mover.models import Template
 from cloud_mover.services.auth import generate_code
 
-MAX_CODE_GENERATION_ATTEMPTS = 100
+CODE_BATCH_SIZE = 16
+MAX_CODE_BATCH_ATTEMPTS = 8
 
 
 def create_template(
@@ -20,12 +21,16 @@ def create_template(
     description: Optional[str] = None,
 ) -> Template:
     """Create a new template record with unique code."""
-    # Generate unique code
-    for _ in range(MAX_CODE_GENERATION_ATTEMPTS):
-        code = generate_code()
-        # Check both Template and Backup tables to avoid code collision
-        existing = session.exec(select(Template).where(Template.code == code)).first()
-        if not existing:
+    # Generate a batch of candidate codes and rule them out with a single
+    # indexed IN lookup instead of one SELECT per candidate
+    for _ in range(MAX_CODE_BATCH_ATTEMPTS):
+        candidates = {generate_code() for _ in range(CODE_BATCH_SIZE)}
+        taken = set(
+            session.exec(select(Template.code).where(Template.code.in_(candidates))).all()
+        )
+        available = candidates - taken
+        if available:
+            code = available.pop()
             break
     else:
         raise RuntimeError("Failed to generate unique code after max attempts")
@@ -43,9 +48,10 @@ def create_template(
         content_size=len(content.encode("utf-8")),
         expires_at=expires_at,
     )
+    # commit's flush assigns the primary key, and sessions keep attributes
+    # live after commit, so no refresh round-trip is needed
     session.add(template)
     session.commit()
-    session.refresh(template)
 
     return template
 
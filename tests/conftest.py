@@ -0,0 +1,11 @@
+"""Shared test configuration."""
+
+import os
+import tempfile
+
+# Point each test process at its own runtime directories before
+# cloud_mover.config is imported, so parallel xdist workers don't race on
+# ./data and serial runs don't litter the working tree.
+_runtime_dir = tempfile.mkdtemp(prefix="cloud-mover-test-")
+os.environ["DATA_DIR"] = os.path.join(_runtime_dir, "data")
+os.environ["UPLOAD_DIR"] = os.path.join(_runtime_dir, "uploads")
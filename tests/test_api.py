@@ -1,48 +1,139 @@
 """Integration tests for API endpoints."""
 
-import io
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
 
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
+from cloud_mover import config
 from cloud_mover.database import get_session
-from cloud_mover.main import app
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
 
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a test database session."""
+# Upload payloads shared across tests, pre-encoded as multipart bodies so
+# the client sends ready bytes instead of re-encoding files= per call.
+SMALL_FILE = b"test backup content"
+LARGE_FILE = b"x" * 1024
+
+_BOUNDARY = "cloudmovertestboundary"
+UPLOAD_HEADERS = {"content-type": f"multipart/form-data; boundary={_BOUNDARY}"}
+
+
+def _multipart_body(payload: bytes) -> bytes:
+    """Encode a payload as the multipart body the upload endpoint expects."""
+    return (
+        (
+            f"--{_BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="backup.zip"\r\n'
+            "Content-Type: application/zip\r\n\r\n"
+        ).encode()
+        + payload
+        + f"\r\n--{_BOUNDARY}--\r\n".encode()
+    )
+
+
+SMALL_UPLOAD_BODY = _multipart_body(SMALL_FILE)
+LARGE_UPLOAD_BODY = _multipart_body(LARGE_FILE)
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture():
+    """Create the shared in-memory engine, building the schema once.
+
+    The cache=shared URI is keyed by xdist worker so every connection in a
+    worker sees the same database while parallel workers stay isolated.
+    StaticPool still pins one connection, which keeps the shared-cache
+    database alive and plays nicely with locking_mode=EXCLUSIVE below.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
     engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
+        f"sqlite:///file:cm_test_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False, "uri": True},
         poolclass=StaticPool,
     )
+
+    @event.listens_for(engine, "connect")
+    def _fast_pragmas(dbapi_connection, connection_record):
+        # Durability doesn't matter for a throwaway test database; skip
+        # sync and journal bookkeeping on every commit
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # Fixed 8 MiB page cache so repeated inserts don't grow it piecemeal
+        cursor.execute("PRAGMA cache_size=-8192")
+        cursor.close()
+
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+    return engine
 
 
-@pytest.fixture(name="client")
-def client_fixture(session: Session, tmp_path):
-    """Create a test client with dependency overrides."""
-    from cloud_mover import config
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Yield a session inside an outer transaction rolled back after each test.
+
+    join_transaction_mode routes the services' commit() calls into
+    SAVEPOINTs, so the rollback restores a clean database without
+    re-running create_all per test.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(connection, join_transaction_mode="create_savepoint") as session:
+            yield session
+        transaction.rollback()
+
+
+# Holder the stable get_session override reads from, so the override
+# callable registered with the app keeps its identity across tests
+_override_session = {"session": None}
 
-    original_upload_dir = config.settings.upload_dir
-    config.settings.upload_dir = tmp_path / "uploads"
-    config.settings.upload_dir.mkdir(parents=True, exist_ok=True)
 
-    def get_session_override():
-        yield session
+def _get_session_override():
+    yield _override_session["session"]
 
-    app.dependency_overrides[get_session] = get_session_override
 
-    with TestClient(app) as client:
-        yield client
+@pytest.fixture(name="client_app", scope="session")
+def client_app_fixture():
+    """Create one TestClient for the whole session, without lifespan.
 
+    Every test overrides get_session and none relies on the startup
+    init/cleanup, so the ASGI lifespan cycle is skipped entirely. The
+    override is registered once; tests only swap the session it yields.
+
+    The app and client imports live here so collection doesn't pay for
+    loading the whole application module.
+    """
+    from fastapi.testclient import TestClient
+
+    from cloud_mover.main import app
+
+    app.dependency_overrides[get_session] = _get_session_override
+    yield TestClient(app)
     app.dependency_overrides.clear()
-    config.settings.upload_dir = original_upload_dir
+
+
+@pytest.fixture(name="upload_dir", scope="module")
+def upload_dir_fixture(tmp_path_factory):
+    """Create one upload directory shared by the module's tests."""
+    return tmp_path_factory.mktemp("uploads")
+
+
+@pytest.fixture(name="client")
+def client_fixture(client_app: TestClient, session: Session, upload_dir, monkeypatch):
+    """Point the shared client's session dependency at this test's session."""
+    monkeypatch.setattr(config.settings, "upload_dir", upload_dir)
+    _override_session["session"] = session
+
+    yield client_app
+
+    _override_session["session"] = None
 
 
 def test_root_returns_documentation(client: TestClient):
@@ -56,11 +147,7 @@ def test_root_returns_documentation(client: TestClient):
 
 def test_upload_returns_code(client: TestClient):
     """Upload should return a 6-character code."""
-    file_content = b"test backup content"
-    response = client.post(
-        "/upload",
-        files={"file": ("backup.zip", io.BytesIO(file_content), "application/zip")},
-    )
+    response = client.post("/upload", content=SMALL_UPLOAD_BODY, headers=UPLOAD_HEADERS)
     assert response.status_code == 200
 
     data = response.json()
@@ -70,39 +157,27 @@ def test_upload_returns_code(client: TestClient):
     assert "expires_at" in data
 
 
-def test_upload_rejects_large_file(client: TestClient):
+def test_upload_rejects_large_file(client: TestClient, monkeypatch):
     """Upload should reject files exceeding size limit."""
-    from cloud_mover import config
+    monkeypatch.setattr(config.settings, "max_file_size_mb", 0)
 
-    original_max = config.settings.max_file_size_mb
-    config.settings.max_file_size_mb = 0  # Set to 0 MB for test
-
-    file_content = b"x" * 1024  # 1KB file
-    response = client.post(
-        "/upload",
-        files={"file": ("backup.zip", io.BytesIO(file_content), "application/zip")},
-    )
+    response = client.post("/upload", content=LARGE_UPLOAD_BODY, headers=UPLOAD_HEADERS)
     assert response.status_code == 400
 
-    config.settings.max_file_size_mb = original_max
-
 
-def test_full_upload_download_flow(client: TestClient):
-    """Test complete upload and download flow."""
-    file_content = b"this is a test backup file content"
+@pytest.fixture(name="uploaded_code")
+def uploaded_code_fixture(client: TestClient) -> str:
+    """Upload the shared payload and return its verification code."""
+    response = client.post("/upload", content=SMALL_UPLOAD_BODY, headers=UPLOAD_HEADERS)
+    assert response.status_code == 200
+    return response.json()["code"]
 
-    # Upload
-    upload_response = client.post(
-        "/upload",
-        files={"file": ("backup.zip", io.BytesIO(file_content), "application/zip")},
-    )
-    assert upload_response.status_code == 200
-    code = upload_response.json()["code"]
 
-    # Download
-    download_response = client.get(f"/download/{code}")
+def test_full_upload_download_flow(client: TestClient, uploaded_code: str):
+    """Downloading an uploaded backup should return its content."""
+    download_response = client.get(f"/download/{uploaded_code}")
     assert download_response.status_code == 200
-    assert download_response.content == file_content
+    assert download_response.content == SMALL_FILE
 
 
 def test_download_invalid_code_format(client: TestClient):
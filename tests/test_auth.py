@@ -1,31 +1,36 @@
 """Tests for auth service."""
 
+import pytest
+
 from cloud_mover.services.auth import generate_code, is_valid_code
 
 
-def test_generate_code_length():
-    """Generated code should be 6 characters."""
-    code = generate_code()
-    assert len(code) == 6
+@pytest.fixture(name="code_sample", scope="module")
+def code_sample_fixture():
+    """Generate one batch of codes shared by the format and uniqueness tests."""
+    return [generate_code() for _ in range(100)]
+
+
+def test_generate_code_length(code_sample):
+    """Generated codes should be 6 characters."""
+    assert all(len(code) == 6 for code in code_sample)
 
 
-def test_generate_code_alphanumeric():
-    """Generated code should be alphanumeric lowercase."""
-    code = generate_code()
-    assert code.isalnum()
-    assert code.islower()
+def test_generate_code_alphanumeric(code_sample):
+    """Generated codes should be alphanumeric lowercase."""
+    assert all(code.isalnum() and code.islower() for code in code_sample)
 
 
-def test_generate_code_unique():
+def test_generate_code_unique(code_sample):
     """Generated codes should be unique."""
-    codes = {generate_code() for _ in range(100)}
-    assert len(codes) == 100
+    assert len(set(code_sample)) == len(code_sample)
 
 
-def test_is_valid_code_correct():
-    """Valid code should pass validation."""
+def test_is_valid_code_correct(code_sample):
+    """Valid codes should pass validation."""
     assert is_valid_code("abc123") is True
     assert is_valid_code("xyz789") is True
+    assert all(map(is_valid_code, code_sample))
 
 
 def test_is_valid_code_wrong_length():